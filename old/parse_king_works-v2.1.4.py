@@ -67,6 +67,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lowercased format token -> column name, so process_formats can resolve each
+# token with a single dict lookup instead of six substring tests.
+_FORMAT_TOKEN_MAP = {
+    "hardcover": "Hardcover",
+    "paperback": "Paperback",
+    "kindle": "Ebook",
+    "ebook": "Ebook",
+    "audio": "Audiobook",
+    "audiobook": "Audiobook",
+    "movie": "Movie",
+    "tv": "Miniseries",
+    "miniseries": "Miniseries",
+}
+
+_EMPTY_FORMATS = {
+    "Hardcover": "",
+    "Paperback": "",
+    "Ebook": "",
+    "Audiobook": "",
+    "Movie": "",
+    "Miniseries": "",
+}
+
 
 @dataclass
 class WorkData:
@@ -349,19 +372,16 @@ class KingWorksParser:
                         formats.add(format_type)
                         logger.info(f"Found format {format_type} in format section")
 
-            # Check all possible containers if we haven't found all formats
+            # Fall back to one scan of the full page text if we haven't found
+            # all formats, instead of re-walking every common container
             if len(formats) < len(format_indicators):
-                containers = soup.find_all(["div", "section", "span", "p", "li", "a"])
-                for container in containers:
-                    text = container.get_text(strip=True).lower()
-                    for format_type, indicators in format_indicators.items():
-                        if format_type not in formats and any(
-                            indicator in text for indicator in indicators
-                        ):
-                            formats.add(format_type)
-                            logger.info(
-                                f"Found format {format_type} in general content"
-                            )
+                full_text = soup.get_text(" ", strip=True).lower()
+                for format_type, indicators in format_indicators.items():
+                    if format_type not in formats and any(
+                        indicator in full_text for indicator in indicators
+                    ):
+                        formats.add(format_type)
+                        logger.info(f"Found format {format_type} in general content")
 
             # Check metadata
             meta_description = soup.find("meta", {"name": "description"})
@@ -608,33 +628,15 @@ class KingWorksParser:
         Returns:
             Dict[str, str]: Dictionary with format types as keys and '✓' or '' as values
         """
-        formats_dict = {
-            "Hardcover": "",
-            "Paperback": "",
-            "Ebook": "",
-            "Audiobook": "",
-            "Movie": "",
-            "Miniseries": "",
-        }
+        formats_dict = dict(_EMPTY_FORMATS)
 
         if not formats_str:
             return formats_dict
 
-        format_list = [fmt.strip() for fmt in formats_str.split(",")]
-        for fmt in format_list:
-            fmt = fmt.strip()
-            if "Hardcover" in fmt:
-                formats_dict["Hardcover"] = "✓"
-            if "Paperback" in fmt:
-                formats_dict["Paperback"] = "✓"
-            if "Kindle" in fmt or "eBook" in fmt:
-                formats_dict["Ebook"] = "✓"
-            if "Audio" in fmt or "Audiobook" in fmt:
-                formats_dict["Audiobook"] = "✓"
-            if "Movie" in fmt:
-                formats_dict["Movie"] = "✓"
-            if "TV" in fmt or "Miniseries" in fmt:
-                formats_dict["Miniseries"] = "✓"
+        for token in formats_str.lower().split(","):
+            column = _FORMAT_TOKEN_MAP.get(token.strip())
+            if column:
+                formats_dict[column] = "✓"
 
         return formats_dict
 
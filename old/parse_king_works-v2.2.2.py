@@ -3,24 +3,25 @@ Module for parsing and organizing Stephen King's literary works from his officia
 Provides functionality to scrape, process, and export work details to various formats including CSV.
 """
 
-import argparse
-import concurrent.futures
+import atexit
 import csv
-import glob
+import functools
+import json
 import logging
+import os
 import re
 import threading
 import time
-from collections import defaultdict
+from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Iterable, List, Optional
 from urllib.parse import urljoin
 
-import pandas as pd
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -72,8 +73,424 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: these run per row during export, and calling
+# .match()/.search() on the compiled pattern skips re's internal cache lookup.
+_HYPERLINK_ESCAPED_RE = re.compile(
+    r'=HYPERLINK\("((?:[^"]|"")+)",\s*"((?:[^"]|"")+)"\)'
+)
+_HYPERLINK_RE = re.compile(r'HYPERLINK\("([^"]+)",\s*"([^"]+)"\)')
+_HYPERLINK_TEXT_RE = re.compile(r'HYPERLINK\("[^"]*",\s*"([^"]+)"\)')
+_HTML_ANCHOR_TEXT_RE = re.compile(r">([^<]+)</a>")
+
+# Title-cleaning patterns, compiled once; the three trailing-edition variants
+# fold into a single alternation so each title is scanned once.
+_RE_SPECIAL = re.compile(r"[^\w\s\-\'.,]")
+_RE_EDITION_SUFFIX = re.compile(
+    r"(?:\s*:\s*the\s+complete\s+(?:&|and)\s+uncut\s+edition"
+    r"|\s*:\s*(?:expanded|limited|special|collectors?)\s+edition"
+    r"|\s+edition)\s*$"
+)
+_RE_PAREN_SUFFIX = re.compile(r"\s*\([^)]*\)\s*$")
+
+# The ASCII characters _RE_SPECIAL strips.  Most titles contain none of
+# them, so a C-level isdisjoint check lets clean_title skip the regex
+# engine entirely for the common case.
+_SPECIAL_CHARS = frozenset('!"#$%&()*+/:;<=>?@[\\]^`{|}~')
+
+# Work types whose publication dates propagate to their member works.
+_COLLECTION_TYPES = frozenset({"collection", "anthology", "story collection"})
+
+# Same escapes html.escape(quote=True) produces, but applied with
+# str.translate — a single C pass with no Python-level branching.
+_ATTR_ESCAPE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
+
+# Every real date in the data is plain YYYY-MM-DD; validating with this
+# first lets the hot paths use fromisoformat (a C fast path) instead of
+# strptime's format interpreter, and keeps placeholder strings like
+# 0000-00-00 from ever reaching the parser.
+_DATE_RE = re.compile(r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(date_str: str) -> tuple[str, str]:
+    """Resolve a published-date string to its (display, sort) pair.
+
+    Memoized because publication dates repeat heavily across the
+    bibliography (collections share dates with all their members), so
+    each distinct string is validated once per run.
+    """
+    if date_str and _DATE_RE.fullmatch(date_str):
+        return (date_str, date_str)
+    return ("", "9999-99-99")
+
+
+# Timestamp embedded in generated filenames, for recovering it from an
+# existing CSV on the --html path.
+_CSV_TS_RE = re.compile(r"stephen_king_works_(\d{8}_\d{6})\.csv$")
+
+
+@functools.lru_cache(maxsize=1)
+def _run_timestamp() -> str:
+    """Filename timestamp, computed once and shared for the whole run.
+
+    Inline integer formatting instead of strftime: the padded f-string
+    slots render directly without the format-string interpreter, and the
+    memoization guarantees the CSV and HTML names always agree.
+    """
+    n = datetime.now()
+    return (
+        f"{n.year:04d}{n.month:02d}{n.day:02d}_"
+        f"{n.hour:02d}{n.minute:02d}{n.second:02d}"
+    )
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD string, returning None for anything invalid."""
+    if not _DATE_RE.fullmatch(date_str):
+        return None
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:  # calendar-invalid, e.g. Feb 30
+        return None
+
+
+# Compiled selectors for the works index.  One XPath pass pulls every work
+# anchor out of the lxml tree, and the per-element title/type lookups stay
+# in C instead of going through bs4's Python-level find machinery.
+_WORKS_XPATH = etree.XPath(
+    '//a[contains(concat(" ", normalize-space(@class), " "), " row ")'
+    ' and contains(concat(" ", normalize-space(@class), " "), " work ")]'
+)
+_WORK_TITLE_XPATH = etree.XPath('.//div[contains(@class, "works-title")]')
+_WORK_TYPE_XPATH = etree.XPath('.//div[contains(@class, "works-type")]')
+# Member anchors on a collection page, scoped to the content grids the
+# same way the Available In lookup is, so navigation and other stray
+# text-links elsewhere on the page are never taken for members.
+_MEMBER_LINKS_XPATH = etree.XPath(
+    '//div[contains(@class, "grid-content")]//a[contains(@class, "text-link")]'
+)
+
+# Compiled once: the whole Available In lookup (header -> nearest
+# grid-content -> its text-link anchors) runs as one C-level traversal
+# instead of three Python-side find calls per detail page.
+_AVAILABLE_IN_XPATH = etree.XPath(
+    '//h2[normalize-space(.)="Available In"]'
+    '/following::div[contains(@class, "grid-content")][1]'
+    '//a[contains(@class, "text-link")]'
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_hyperlink_once(excel_formula: str) -> tuple[str, str]:
+    """Split an Excel HYPERLINK formula into (url, text).
+
+    Memoized: when rows are reloaded from a CSV the same collection
+    formula appears on every member work, so each distinct formula is
+    regex-matched only once.
+    """
+    if not excel_formula.startswith("=HYPERLINK("):
+        return ("", excel_formula)
+
+    # Use a more robust regex that handles escaped quotes
+    match = _HYPERLINK_ESCAPED_RE.match(excel_formula)
+    if match:
+        url = match.group(1).replace('""', '"')
+        text = match.group(2).replace('""', '"')
+        return (url, text)
+    return ("", excel_formula)
+
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _excel_hyperlink_to_html(excel_formula: str) -> str:
+    """Convert an Excel HYPERLINK formula to an HTML anchor tag.
+
+    Memoized because the Available In column repeats the same collection
+    formula across many member works.
+    """
+    if not excel_formula or not excel_formula.startswith("=HYPERLINK"):
+        return excel_formula
+
+    match = _HYPERLINK_RE.search(excel_formula)
+    if match:
+        url, text = match.groups()
+        return f'<a href="{url}"><strong>{text}</strong></a>'
+    return excel_formula
+
+
+# Precompiled row template: the static markup is laid out once here and each
+# row only fills in its slots, instead of re-evaluating a large f-string.
+# The READ/OWNED cells share one checkbox fragment, specialized per column
+# at import time.
+_CHECKBOX_TD = (
+    '<td class="narrow-col"><input type="checkbox" class="status-checkbox" '
+    'data-title="%%s" data-type="%s"%s></td>'
+)
+# Only four (read, owned) states exist, so the two checkbox cells are fully
+# rendered here for each state; per row all that remains is substituting
+# the escaped title into the two %s slots.
+_CHECKBOX_PAIR = {
+    (read, owned): _CHECKBOX_TD % ("read", " checked" if read else "")
+    + _CHECKBOX_TD % ("owned", " checked" if owned else "")
+    for read in (False, True)
+    for owned in (False, True)
+}
+_ROW_TMPL = (
+    '<td class="date-col" data-sort="{sort_date}">{display_date}</td>'
+    '<td class="title-col">{title_html}</td>'
+    '<td class="type-col">{work_type}</td>'
+    '<td class="collection-col">{collection_html}</td></tr>'
+)
+
+_TABLE_HEADER = (
+    '<table class="works-table">'
+    "<thead><tr>"
+    '<th class="narrow-col">Read</th>'
+    '<th class="narrow-col">Owned</th>'
+    '<th class="date-col">Published</th>'
+    '<th class="title-col">Title</th>'
+    '<th class="type-col">Type</th>'
+    '<th class="collection-col">Collection</th>'
+    "</tr></thead><tbody>"
+)
+
+
+def _render_row(row: "ExportRow") -> str:
+    """Render one ExportRow as a complete <tr> string."""
+    # Memoized: repeated date strings hit the cache instead of
+    # re-validating; invalid and empty dates sort last via the sentinel
+    display_date, sort_date = _parse_iso_date(row.published)
+
+    # Escape each text field exactly once and reuse it for both the
+    # data-title attribute and the visible anchor text
+    escaped_title = row.title.translate(_ATTR_ESCAPE)
+    escaped_collection = row.collection.translate(_ATTR_ESCAPE)
+    title_html = (
+        f'<a href="{row.url}"><strong>{escaped_title}</strong></a>'
+        if row.url
+        else escaped_title
+    )
+    collection_html = (
+        f'<a href="{row.collection_url}"><strong>{escaped_collection}</strong></a>'
+        if row.collection and row.collection_url
+        else escaped_collection
+    )
+
+    checkboxes = _CHECKBOX_PAIR[(bool(row.read), bool(row.owned))]
+    return (
+        "<tr>"
+        + checkboxes % (escaped_title, escaped_title)
+        + _ROW_TMPL.format(
+            sort_date=sort_date,
+            display_date=display_date,
+            title_html=title_html,
+            work_type=row.work_type,
+            collection_html=collection_html,
+        )
+    )
+
+
+# The document shell around the generated table is static, so it lives here
+# as two plain constants (no brace escaping, no per-export f-string work).
+# _HTML_PREFIX ends right where the table markup is inserted.
+_HTML_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Stephen King Bibliography</title>
+    <link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;800&display=swap" rel="stylesheet">
+    <link href="https://fonts.googleapis.com/css2?family=Special+Elite&display=swap" rel="stylesheet">
+    <link href="https://fonts.cdnfonts.com/css/portrait-condensed" rel="stylesheet">
+    <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.css">
+    <style>
+        :root {
+            --blood-red: #8B0000;
+            --blood-red-hover: #A00000;
+            --border-color: #2c3e50;
+            --hover-color: #2a2a2a;
+            --text-secondary: #b3b3b3;
+            --background-dark: #1e1e1e;
+            --background-darker: #252525;
+            --text-primary: #ffffff;
+        }
+
+        body {
+            font-family: 'Plus Jakarta Sans', sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: var(--background-dark);
+            color: var(--text-primary);
+        }
+
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+
+        h1 {
+            font-family: 'Special Elite', cursive;
+            color: var(--blood-red);
+            text-align: center;
+            margin-bottom: 30px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
+            font-size: 3.5rem;
+            letter-spacing: 2px;
+        }
+
+        /* DataTables Customization */
+        .dataTables_wrapper {
+            margin-top: 20px;
+            padding: 20px;
+            background-color: var(--background-darker);
+            border-radius: 8px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.3);
+        }
+
+        .dataTables_filter input {
+            border: 1px solid #2c3e50 !important;
+            border-radius: 4px !important;
+            padding: 6px 10px !important;
+            background-color: var(--background-dark) !important;
+            color: var(--text-primary) !important;
+        }
+
+        .dataTables_length select {
+            border: 1px solid #2c3e50 !important;
+            border-radius: 4px !important;
+            padding: 4px 8px !important;
+            background-color: var(--background-dark) !important;
+            color: var(--text-primary) !important;
+        }
+
+        /* Table Styling */
+        .works-table {
+            background-color: var(--background-darker) !important;
+            color: var(--text-primary) !important;
+        }
+
+        .works-table thead th {
+            background-color: #990000 !important;  /* Deeper blood red for headers */
+            color: var(--text-primary) !important;
+            border-bottom: 2px solid var(--border-color) !important;
+        }
+
+        .works-table tbody td {
+            background-color: var(--background-darker) !important;
+            color: var(--text-primary) !important;
+            border-bottom: 1px solid var(--border-color) !important;
+        }
+
+        .works-table tbody tr:hover td {
+            background-color: var(--hover-color) !important;
+        }
+
+        /* DataTables specific styling */
+        .dataTables_info,
+        .dataTables_length label,
+        .dataTables_filter label {
+            color: var(--text-secondary) !important;
+        }
+
+        .paginate_button {
+            color: var(--text-secondary) !important;
+            background-color: var(--background-darker) !important;
+        }
+
+        .paginate_button.current {
+            color: var(--text-primary) !important;
+            background-color: #990000 !important;  /* Matching header color */
+            border: 1px solid #990000 !important;
+        }
+
+        /* Links styling */
+        .works-table a {
+            color: #cc0000 !important;  /* Brighter red for links */
+            text-decoration: none !important;
+        }
+
+        .works-table a:hover {
+            color: #ff0000 !important;  /* Even brighter on hover */
+            text-decoration: underline !important;
+        }
+
+        /* Completely remove sort arrows */
+        .works-table thead th,
+        table.dataTable thead th,
+        .works-table thead td,
+        table.dataTable thead td {
+            background-image: none !important;
+            padding-right: 8px !important;  /* Remove extra padding that was for arrows */
+        }
+
+        /* Override all DataTables sorting classes */
+        table.dataTable thead .sorting::before,
+        table.dataTable thead .sorting::after,
+        table.dataTable thead .sorting_asc::before,
+        table.dataTable thead .sorting_asc::after,
+        table.dataTable thead .sorting_desc::before,
+        table.dataTable thead .sorting_desc::after,
+        table.dataTable thead .sorting_asc_disabled::before,
+        table.dataTable thead .sorting_asc_disabled::after,
+        table.dataTable thead .sorting_desc_disabled::before,
+        table.dataTable thead .sorting_desc_disabled::after {
+            display: none !important;
+            content: "" !important;
+        }
+
+        /* Optional: Add a subtle cursor change to indicate sortable columns */
+        .works-table thead th,
+        table.dataTable thead th {
+            cursor: pointer;
+        }
+    </style>
+    <script type="text/javascript" src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
+    <script type="text/javascript" src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
+    <script>
+        $(document).ready(function() {
+            $('.works-table').DataTable({
+                pageLength: 50,
+                order: [[2, 'asc']],
+                fixedHeader: true
+            });
+
+            $('.status-checkbox').change(function() {
+                const checkbox = $(this);
+                const title = checkbox.data('title');
+                const type = checkbox.data('type');
+                const isChecked = checkbox.prop('checked');
+                console.log(`${type} status for "${title}" changed to: ${isChecked}`);
+            });
+        });
+    </script>
+</head>
+<body>
+    <div class="container">
+        <h1>Stephen King Bibliography</h1>
+        """
+
+_HTML_SUFFIX = """
+    </div>
+</body>
+</html>"""
+
+# Pre-encoded once: the HTML file is written in binary mode, so the static
+# chunks skip TextIOWrapper's per-write encode and only the row strings
+# are encoded at export time.
+_HTML_PREFIX_BYTES = _HTML_PREFIX.encode("utf-8")
+_HTML_SUFFIX_BYTES = _HTML_SUFFIX.encode("utf-8")
+_TABLE_HEADER_BYTES = _TABLE_HEADER.encode("utf-8")
+_TABLE_FOOTER_BYTES = b"</tbody></table>"
+
+
+@dataclass(slots=True)
 class WorkData:
     """Data class to store information about a work"""
 
@@ -84,33 +501,126 @@ class WorkData:
     work_type: str
     available_in: str
     available_in_link: str
+    cleaned_available_in: str = ""
+
+
+# Structured export row: title and URL stay separate all the way to the
+# writers, so the CSV formats its HYPERLINK formula on the fly and the HTML
+# builds anchors directly — nothing round-trips through an Excel formula
+# string just to be regex-parsed back apart.
+ExportRow = namedtuple(
+    "ExportRow", "read owned published title url work_type collection collection_url"
+)
 
 
 class RequestManager:
-    """Manages HTTP requests with rate limiting"""
+    """Manages HTTP requests with token-bucket rate limiting.
+
+    Unlike the old fixed sleep between requests, a token bucket lets a
+    burst of requests go out immediately (up to ``burst``) while keeping
+    the sustained rate at one request per ``rate_limit`` seconds.
+    """
 
-    def __init__(self, rate_limit: float = 1.0):
-        self.rate_limit = rate_limit
-        self.last_request_time = 0
+    def __init__(
+        self,
+        rate_limit: float = 1.0,
+        burst: int = 10,
+        session: Optional[requests.Session] = None,
+        cache_path: str = ".king_works_http_cache.json",
+    ):
+        self.rate = 1.0 / rate_limit  # tokens refilled per second
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.token_lock = threading.Lock()
+        self.session = session if session is not None else requests.Session()
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.WARNING)  # Keep only warnings and errors
+        # Conditional-GET cache: url -> {etag, last_modified, body}.  On
+        # repeat runs unchanged pages come back as bodiless 304s and the
+        # cached body is served instead, so re-runs cost almost no
+        # transfer.  Persisted once at interpreter exit, not per request.
+        self.cache_path = cache_path
+        self.cache_lock = threading.Lock()
+        self.cache = self._load_cache()
+        atexit.register(self._save_cache)
+
+    def _load_cache(self) -> dict:
+        """Load the conditional-GET cache, tolerating a missing file."""
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        """Persist the conditional-GET cache for the next run."""
+        if not self.cache:
+            return
+        try:
+            with open(self.cache_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                json.dump(self.cache, f)
+        except OSError as e:
+            self.logger.warning(f"Could not persist HTTP cache: {e}")
+
+    def _acquire_token(self):
+        """Take one token, sleeping off any deficit outside the lock.
+
+        Each thread deducts under the lock and sleeps only its own share
+        of the deficit, so concurrent workers queue behind the bucket in
+        staggered order instead of stampeding or serializing each other.
+        """
+        with self.token_lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1.0
+            deficit = -self.tokens if self.tokens < 0 else 0.0
+        if deficit:
+            time.sleep(deficit / self.rate)
 
     def get(self, url: str) -> Optional[requests.Response]:
-        """Make a GET request with rate limiting"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """Make a GET request with rate limiting and conditional caching"""
+        self._acquire_token()
 
-        if time_since_last_request < self.rate_limit:
-            time.sleep(self.rate_limit - time_since_last_request)
+        cached = self.cache.get(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
-            response = requests.get(url)
-            self.last_request_time = time.time()
-            return response
+            response = self.session.get(url, timeout=10, headers=headers or None)
         except Exception as e:
             self.logger.warning(f"Request failed: {str(e)}")
             return None
 
+        if response.status_code == 304 and cached:
+            # Unchanged since last run: synthesize a normal 200 response
+            # around the cached body so callers stay oblivious
+            replay = requests.Response()
+            replay.status_code = 200
+            replay.url = url
+            replay.encoding = "utf-8"
+            replay._content = cached["body"].encode("utf-8")
+            return replay
+
+        if response.ok:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                with self.cache_lock:
+                    self.cache[url] = {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "body": response.text,
+                    }
+        return response
+
 
 class KingWorksParser:
     """
@@ -124,18 +634,58 @@ class KingWorksParser:
 
     BASE_URL = "https://www.stephenking.com"
     WORKS_URL = f"{BASE_URL}/works/"
-    MAX_WORKERS = 10  # Increased from 5 for better parallelization
+    MAX_WORKERS = 20  # Requests spend almost all their time blocked on I/O
 
     def __init__(self):
+        # One pooled session shared by every worker thread: keep-alive means
+        # a single TLS handshake amortized over all detail-page fetches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_WORKERS,
+            pool_maxsize=self.MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": "stephen-king-parser/2.2.2",
+                # br is deliberately not advertised: requests only
+                # decodes brotli when a brotli package is installed
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
         self.request_manager = RequestManager(
-            rate_limit=0.5
+            rate_limit=0.5, session=self.session
         )  # Decreased from 1.0 to 0.5 seconds
         self.works_dict = {}
         self.collection_dates = {}
-        self.processed_urls = set()
-        self.url_lock = threading.Lock()
-        self.data_lock = threading.Lock()
-        self.session = requests.Session()  # Add session for connection pooling
+        # Reverse map built from the collection pages themselves:
+        # cleaned member title -> (collection name, collection url).
+        # Filling this from the handful of collection pages saves a
+        # detail-page fetch for every member work.
+        self.member_to_collection = {}
+        # Fallback memo for extract_collection_info, keyed by work URL;
+        # benign data races just repeat one fetch, so no lock is needed.
+        self._collection_info_cache = {}
+        # Shared worker pool, created on first use and reused by every
+        # parse phase in the run; threads are spawned lazily up to
+        # MAX_WORKERS, so small runs never allocate idle thread stacks.
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix="king-worker"
+            )
+        return self._executor
+
+    def close(self):
+        """Shut down the shared worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def clean_title(self, title: str) -> str:
         """
@@ -148,37 +698,27 @@ class KingWorksParser:
         Returns:
             str: Cleaned title for comparison
         """
-        # Remove special characters but keep basic punctuation
-        cleaned = re.sub(r"[^\w\s\-\'.,]", "", title)
+        # Remove special characters but keep basic punctuation; plain
+        # ASCII titles with none of the stripped characters skip the
+        # regex pass entirely
+        if title.isascii() and _SPECIAL_CHARS.isdisjoint(title):
+            cleaned = title
+        else:
+            cleaned = _RE_SPECIAL.sub("", title)
 
         # Convert to lowercase for comparison
         cleaned = cleaned.lower()
 
-        # Remove common suffixes and variations
-        cleaned = re.sub(
-            r"\s*:\s*the\s+complete\s+(?:&|and)\s+uncut\s+edition\s*$", "", cleaned
-        )
-        cleaned = re.sub(
-            r"\s*:\s*(?:expanded|limited|special|collectors?)\s+edition\s*$",
-            "",
-            cleaned,
-        )
-        cleaned = re.sub(r"\s+edition\s*$", "", cleaned)
+        # Remove common edition suffixes and variations in one pass.
+        # Every branch of the pattern contains "edition", so a substring
+        # miss (the overwhelmingly common case) never enters the regex.
+        if "edition" in cleaned:
+            cleaned = _RE_EDITION_SUFFIX.sub("", cleaned)
 
         # Normalize whitespace
         cleaned = " ".join(cleaned.split())
         return cleaned
 
-    def is_url_processed(self, url: str) -> bool:
-        """Thread-safe check if URL has been processed"""
-        with self.url_lock:
-            return url in self.processed_urls
-
-    def mark_url_processed(self, url: str):
-        """Thread-safe marking of URL as processed"""
-        with self.url_lock:
-            self.processed_urls.add(url)
-
     @staticmethod
     def remove_parenthetical_suffix(title: str) -> str:
         """
@@ -190,11 +730,9 @@ class KingWorksParser:
         Returns:
             str: The title with any trailing parenthetical content removed and whitespace trimmed
         """
-        # Use regex to remove any text within parentheses at the end of the string
-        # \s* matches optional whitespace before and after the parentheses
-        # \([^)]*\) matches anything between parentheses
-        # $ ensures we only match parentheses at the end of the string
-        return re.sub(r"\s*\([^)]*\)\s*$", "", title).strip()
+        # _RE_PAREN_SUFFIX matches any parenthesized text (plus surrounding
+        # whitespace) at the end of the string only
+        return _RE_PAREN_SUFFIX.sub("", title).strip()
 
     @staticmethod
     def create_excel_hyperlink(url: str, text: str) -> str:
@@ -230,15 +768,14 @@ class KingWorksParser:
         if not date_str or not isinstance(date_str, str):
             return datetime(9999, 12, 31)
 
-        try:
-            # Attempt to parse the date string into a datetime object
-            return datetime.strptime(date_str.strip(), "%Y-%m-%d")
-        except (ValueError, AttributeError):
-            # Return far-future date if parsing fails
-            return datetime(9999, 12, 31)
+        return _parse_date(date_str.strip()) or datetime(9999, 12, 31)
 
     def extract_collection_info(self, work) -> tuple[str, str]:
-        """Extract collection information from a work's dedicated page."""
+        """Extract collection information from a work's dedicated page.
+
+        Results are memoized per work URL, so a repeated element (or a
+        re-parse in the same run) never refetches the page.
+        """
         try:
             # Get the work's specific URL
             work_url = work.get("href", "")
@@ -249,42 +786,104 @@ class KingWorksParser:
             if not work_url.startswith("http"):
                 work_url = urljoin(self.BASE_URL, work_url)
 
+            cached = self._collection_info_cache.get(work_url)
+            if cached is not None:
+                return cached
+
             # Fetch the work's dedicated page
             response = self.request_manager.get(work_url)
             if not response:
                 return ("", "")
 
-            # Parse the page
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Find the "Available In" section
-            available_in = soup.find("h2", string="Available In")
-            if not available_in:
-                return ("", "")
+            # Parse the page; bytes input lets lxml handle decoding itself
+            tree = lxml.html.fromstring(response.content)
 
-            # Find the collection link in the section following the "Available In" header
-            collection_section = available_in.find_next("div", class_="grid-content")
-            if not collection_section:
-                return ("", "")
-
-            # Find the collection link
-            collection_link = collection_section.find("a", class_="text-link")
-            if not collection_link:
+            # One compiled-XPath pass finds the first collection anchor
+            # under the Available In header (or nothing at all)
+            links = _AVAILABLE_IN_XPATH(tree)
+            if not links:
+                self._collection_info_cache[work_url] = ("", "")
                 return ("", "")
+            collection_link = links[0]
 
             # Extract collection name and URL
-            collection_name = collection_link.text.strip()
+            collection_name = collection_link.text_content().strip()
             collection_url = collection_link.get("href", "")
             if collection_url and not collection_url.startswith("http"):
                 collection_url = urljoin(self.BASE_URL, collection_url)
 
-            return (collection_name, collection_url)
+            info = (collection_name, collection_url)
+            self._collection_info_cache[work_url] = info
+            return info
 
         except Exception as e:
             logger.error(f"Error extracting collection info from {work_url}: {str(e)}")
             return ("", "")
 
-    def process_work(self, work: BeautifulSoup) -> Optional[WorkData]:
+    def build_collection_index(self, work_elements) -> None:
+        """Build the member-title -> collection reverse map up front.
+
+        The index page already tells us which entries are collections, and
+        each collection page lists its member works once.  Fetching the few
+        dozen collection pages and inverting their member lists means the
+        hundreds of member works never need their own detail-page fetch;
+        per-work extraction stays as a fallback for anything the map
+        misses.
+        """
+        collections = []
+        for element in work_elements:
+            type_div = _WORK_TYPE_XPATH(element)
+            if (
+                type_div
+                and type_div[0].text_content().strip().lower() in _COLLECTION_TYPES
+            ):
+                collections.append(element)
+
+        if not collections:
+            return
+
+        def index_collection(element):
+            name_div = _WORK_TITLE_XPATH(element)
+            name = name_div[0].text_content().strip() if name_div else ""
+            url = element.get("href", "")
+            if not name or not url:
+                return
+            if not url.startswith("http"):
+                url = urljoin(self.BASE_URL, url)
+
+            try:
+                response = self.request_manager.get(url)
+                if not response:
+                    return
+                tree = lxml.html.fromstring(response.content)
+                members = []
+                for link in _MEMBER_LINKS_XPATH(tree):
+                    member_title = link.text_content().strip()
+                    if member_title:
+                        members.append(self.clean_title(member_title))
+                return (name, url, members)
+            except Exception as e:
+                # Degrade like the other fetch paths: the member works of a
+                # bad page just fall back to their own detail-page fetch.
+                logger.error(f"Error indexing collection page {url}: {str(e)}")
+
+        # Workers only fetch and parse; the shared map is filled here on
+        # the main thread, in index-page order (executor.map preserves
+        # input order), so a work listed in two collections always
+        # resolves to the same winner from run to run.
+        for result in self.executor.map(index_collection, collections):
+            if not result:
+                continue
+            name, url, members = result
+            for member in members:
+                self.member_to_collection.setdefault(member, (name, url))
+
+        logger.info(
+            f"Indexed {len(self.member_to_collection)} member works "
+            f"from {len(collections)} collection pages"
+        )
+
+    def process_work(self, work: lxml.html.HtmlElement) -> Optional[WorkData]:
         """Process a single work with improved error handling and caching"""
         try:
             # Extract work URL
@@ -292,33 +891,35 @@ class KingWorksParser:
             if not work_url:
                 return None
 
-            # Check if already processed
-            if self.is_url_processed(work_url):
-                return None
-
             # Make sure we have a full URL
             if not work_url.startswith("http"):
                 work_url = urljoin(self.BASE_URL, work_url)
 
-            # Mark as processed
-            self.mark_url_processed(work_url)
-
-            # Extract work data
-            title = work.find("div", class_="works-title").text.strip()
+            # Extract work data (C-level accessors on the lxml element)
+            title = _WORK_TITLE_XPATH(work)[0].text_content().strip()
             published_date = work.get("data-date", "").strip()
-            work_type = work.find("div", class_="works-type").text.strip()
+            work_type = _WORK_TYPE_XPATH(work)[0].text_content().strip()
+            cleaned_title = self.clean_title(title)
 
-            # Get collection info
-            available_in, available_in_link = self.extract_collection_info(work)
+            # Get collection info from the prebuilt reverse map when we
+            # can; the per-work detail fetch is only the fallback now
+            collection = self.member_to_collection.get(cleaned_title)
+            if collection is not None:
+                available_in, available_in_link = collection
+            else:
+                available_in, available_in_link = self.extract_collection_info(work)
 
             return WorkData(
                 title=title,
-                cleaned_title=self.clean_title(title),
+                cleaned_title=cleaned_title,
                 link=work_url,
                 published_date=published_date,
                 work_type=work_type,
                 available_in=available_in,
                 available_in_link=available_in_link,
+                cleaned_available_in=(
+                    self.clean_title(available_in) if available_in else ""
+                ),
             )
 
         except Exception as e:
@@ -345,19 +946,21 @@ class KingWorksParser:
                 return value
         return work_type.title()
 
-    def batch_process_works(
-        self, works: List[BeautifulSoup], batch_size: int = 20
-    ) -> List[WorkData]:
-        """Process works in batches using ThreadPoolExecutor"""
-        results = []
-        for i in range(0, len(works), batch_size):
-            batch = works[i : i + batch_size]
-            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                futures = [executor.submit(self.process_work, work) for work in batch]
-                for future in concurrent.futures.as_completed(futures):
-                    if work_data := future.result():
-                        results.append(work_data)
-        return results
+    def batch_process_works(self, works: List[lxml.html.HtmlElement]) -> List[WorkData]:
+        """Process all works on a single streaming thread pool.
+
+        The old batched version tore down the pool every 20 works and
+        waited for the slowest request in each batch before starting the
+        next, capping effective concurrency well below MAX_WORKERS.
+        """
+        # map yields results directly instead of allocating a Future per
+        # work plus the as_completed wait machinery, and it keeps results
+        # in page order for free
+        return [
+            work_data
+            for work_data in self.executor.map(self.process_work, works)
+            if work_data
+        ]
 
     def parse_works(self):
         """Main method to parse all works using batched processing"""
@@ -366,8 +969,19 @@ class KingWorksParser:
             logger.error("Failed to fetch main works page")
             return
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        work_elements = soup.find_all("a", class_="row work")
+        tree = lxml.html.fromstring(response.content)
+        work_elements = _WORKS_XPATH(tree)
+
+        # Dedupe by href up front so workers never consult shared state;
+        # the old per-URL processed set needed a lock acquisition inside
+        # every worker just to spot repeats the index itself contains
+        work_elements = list(
+            {work.get("href"): work for work in work_elements}.values()
+        )
+
+        # One fetch per collection page up front, instead of one fetch
+        # per member work later
+        self.build_collection_index(work_elements)
 
         # Process works in batches
         processed_works = self.batch_process_works(work_elements)
@@ -431,33 +1045,31 @@ class KingWorksParser:
         Synchronize publication dates for works appearing in collections.
         Updates works that have no date or '0000-00-00' date with their collection's date.
         """
-        # First, build a dictionary of collection titles and their dates
+        # First, build a dictionary of collection titles and their dates.
+        # Both the raw and cleaned forms were computed in process_work, so
+        # this pass is pure dict stores (no regex work), and identical
+        # raw/cleaned titles are only stored once.
         collection_dates = {}
         for work in works_list:
-            if work.work_type.lower() in [
-                "collection",
-                "anthology",
-                "story collection",
-            ]:
+            if work.work_type.lower() in _COLLECTION_TYPES:
                 if work.published_date and work.published_date != "0000-00-00":
                     collection_dates[work.title] = work.published_date
-                    collection_dates[self.clean_title(work.title)] = work.published_date
+                    if work.cleaned_title != work.title:
+                        collection_dates[work.cleaned_title] = work.published_date
 
-        # Then update works that appear in collections but have no date
+        # Then update works that appear in collections but have no date.
+        # cleaned_available_in was also precomputed in process_work, so the
+        # inner loop is two dict lookups per work with nothing to clean.
         updated_count = 0
         for work in works_list:
             if (
                 not work.published_date or work.published_date == "0000-00-00"
             ) and work.available_in:
-                collection_name = work.available_in
-                cleaned_collection_name = self.clean_title(collection_name)
-
-                # Try all possible matches
-                if collection_name in collection_dates:
-                    work.published_date = collection_dates[collection_name]
-                    updated_count += 1
-                elif cleaned_collection_name in collection_dates:
-                    work.published_date = collection_dates[cleaned_collection_name]
+                date = collection_dates.get(work.available_in) or collection_dates.get(
+                    work.cleaned_available_in
+                )
+                if date:
+                    work.published_date = date
                     updated_count += 1
 
         return updated_count
@@ -465,50 +1077,43 @@ class KingWorksParser:
     def get_sort_key(self, work_data: WorkData):
         """
         Create a sort key for a WorkData object.
-        Returns tuple of (has_date, date_value, title) where:
-        - has_date is True for valid dates (to sort them first)
+        Returns tuple of (missing_date, date_value, title) where:
+        - missing_date is 1 for empty/invalid dates (to sort them last)
         - date_value is the actual date or max date for empty/invalid dates
         - title is used as secondary sort key
         """
         date_str = work_data.published_date.strip() if work_data.published_date else ""
         title = work_data.title
 
-        # Handle empty or invalid dates - use max date to sort them to the end
-        if not date_str or date_str == "0000-00-00":
-            return (False, datetime.max, title)
+        # Empty, placeholder and malformed dates all sort to the end;
+        # _parse_date pre-validates so no exception fires per row
+        parsed_date = _parse_date(date_str) if date_str else None
+        if parsed_date is None:
+            return (1, datetime.max, title)
+        return (0, parsed_date, title)
 
-        try:
-            # Try to parse the date
-            parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
-            return (True, parsed_date, title)
-        except (ValueError, AttributeError):
-            # Invalid date format - sort to end
-            return (False, datetime.max, title)
-
-    def export_to_csv(self, filename: str, works_data: List[List[str]]):
-        """Export works data to CSV file."""
+    def export_to_csv(self, filename: str, works_data: Iterable[ExportRow]):
+        """Export works data to CSV file.
+
+        ``works_data`` may be any iterable of ExportRows; they are
+        streamed to the writer one at a time rather than requiring a
+        materialized list, so callers can feed a generator straight in.
+        """
         # Prepare header row
         header = ["Read", "Owned", "Published", "Title", "Type", "Available In"]
 
-        with open(filename, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_MINIMAL)
+        with open(
+            filename, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as file:
+            writer = csv.writer(file, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
             writer.writerow(header)
+            # create_excel_hyperlink escapes quotes correctly, so the old
+            # per-cell '""' rewrite (which corrupted legitimately escaped
+            # quotes) is gone.
+            writer.writerows(self.row_to_csv_cells(row) for row in works_data)
 
-            for row in works_data:
-                # Process each cell to ensure proper formatting
-                processed_row = []
-                for item in row:
-                    if isinstance(item, str) and item.startswith("=HYPERLINK"):
-                        # Handle hyperlinks with single quotes
-                        item = item.replace(
-                            '""', '"'
-                        )  # Remove any existing double quotes
-                        processed_row.append(item)
-                    else:
-                        processed_row.append(item)
-                writer.writerow(processed_row)
-
-    def parse_excel_hyperlink(self, excel_formula: str) -> tuple[str, str]:
+    @staticmethod
+    def parse_excel_hyperlink(excel_formula: str) -> tuple[str, str]:
         """
         Parse Excel HYPERLINK formula into URL and text components.
 
@@ -520,541 +1125,137 @@ class KingWorksParser:
         """
         # Convert float or other types to string
         excel_formula = str(excel_formula) if excel_formula is not None else ""
+        return _parse_hyperlink_once(excel_formula)
 
-        if not excel_formula.startswith("=HYPERLINK("):
-            return ("", excel_formula)
-
-        # Use a more robust regex that handles escaped quotes
-        match = re.match(
-            r'=HYPERLINK\("((?:[^"]|"")+)",\s*"((?:[^"]|"")+)"\)', excel_formula
-        )
-        if match:
-            url = match.group(1).replace('""', '"')
-            text = match.group(2).replace('""', '"')
-            return (url, text)
-        return ("", excel_formula)
-
-    def excel_hyperlink_to_html(self, excel_formula: str) -> str:
+    @staticmethod
+    def excel_hyperlink_to_html(excel_formula: str) -> str:
         """Convert Excel HYPERLINK formula to HTML anchor tag with bold text."""
-        if not excel_formula or not excel_formula.startswith("=HYPERLINK"):
-            return excel_formula
-
-        # Extract URL and text from Excel formula
-        match = re.search(r'HYPERLINK\("([^"]+)",\s*"([^"]+)"\)', excel_formula)
-        if match:
-            url, text = match.groups()
-            return f'<a href="{url}"><strong>{text}</strong></a>'
-        return excel_formula
+        return _excel_hyperlink_to_html(excel_formula)
 
-    def format_row_for_export(self, work_data: WorkData) -> List[str]:
+    def format_row_for_export(self, work_data: WorkData) -> ExportRow:
         """Format a single work's data for export"""
-        # Create hyperlink for available_in if there's a link
-        available_in = (
-            self.create_excel_hyperlink(
-                work_data.available_in_link, work_data.available_in
-            )
-            if work_data.available_in and work_data.available_in_link
-            else work_data.available_in
+        return ExportRow(
+            read="",
+            owned="",
+            published=work_data.published_date.strip(),
+            title=work_data.title,
+            url=work_data.link,
+            work_type=work_data.work_type,
+            collection=work_data.available_in,
+            collection_url=work_data.available_in_link,
         )
 
-        return [
-            "",  # Read
-            "",  # Owned
-            work_data.published_date.strip(),
-            self.create_excel_hyperlink(
-                work_data.link, work_data.title
-            ),  # Title with hyperlink
-            work_data.work_type,
-            available_in,  # Collection with hyperlink
-        ]
-
-    def generate_html_table(self, rows: List[List[str]]) -> str:
-        """Generate HTML table with proper formatting and structure."""
-        table_html = [
-            '<table class="works-table">',
-            "<thead>",
-            "<tr>",
-            '<th class="narrow-col">Read</th>',
-            '<th class="narrow-col">Owned</th>',
-            '<th class="date-col">Published</th>',
-            '<th class="title-col">Title</th>',
-            '<th class="type-col">Type</th>',
-            '<th class="collection-col">Collection</th>',
-            "</tr>",
-            "</thead>",
-            "<tbody>",
-        ]
-
-        for row in rows:
-            read = row[0]
-            owned = row[1]
-            published_date = row[2]
-            title_formula = row[3]
-            work_type = row[4]
-            collection = row[5]
-
-            # Handle the published date
-            display_date = ""
-            sort_date = "9999-99-99"  # Default sort value for empty dates
-
-            if published_date and published_date not in ["0000-00-00", "9999-99-99"]:
-                try:
-                    parsed_date = datetime.strptime(published_date, "%Y-%m-%d")
-                    display_date = parsed_date.strftime("%Y-%m-%d")
-                    sort_date = display_date
-                except ValueError:
-                    pass
-
-            # Convert Excel hyperlinks to HTML and wrap in bold tags
-            title_html = self.excel_hyperlink_to_html(title_formula)
-            title_html = f"<strong>{title_html}</strong>" if title_html else ""
-
-            collection_html = self.excel_hyperlink_to_html(collection)
-            collection_html = (
-                f"<strong>{collection_html}</strong>" if collection_html else ""
-            )
-
-            table_html.append("<tr>")
-            table_html.extend(
-                [
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="read"{" checked" if read else ""}></td>',
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="owned"{" checked" if owned else ""}></td>',
-                    f'<td class="date-col" data-sort="{sort_date}">{display_date}</td>',
-                    f'<td class="title-col">{title_html}</td>',
-                    f'<td class="type-col">{work_type}</td>',
-                    f'<td class="collection-col">{collection_html}</td>',
-                ]
-            )
-            table_html.append("</tr>")
-
-        table_html.extend(["</tbody>", "</table>"])
-
-        return "\n".join(table_html)
-
-    def generate_html_table(self, rows: List[List[str]]) -> str:
-        """Generate HTML table with proper formatting and structure."""
-        table_html = [
-            '<table class="works-table">',
-            "<thead>",
-            "<tr>",
-            '<th class="narrow-col">Read</th>',
-            '<th class="narrow-col">Owned</th>',
-            '<th class="date-col">Published</th>',
-            '<th class="title-col">Title</th>',
-            '<th class="type-col">Type</th>',
-            '<th class="collection-col">Collection</th>',
-            "</tr>",
-            "</thead>",
-            "<tbody>",
-        ]
-
-        for row in rows:
-            read = row[0]
-            owned = row[1]
-            published_date = row[2]
-            title_formula = row[3]
-            work_type = row[4]
-            collection = row[5]
-
-            # Handle the published date
-            display_date = ""
-            sort_date = "9999-99-99"  # Default sort value for empty dates
-
-            if published_date and published_date not in ["0000-00-00", "9999-99-99"]:
-                try:
-                    parsed_date = datetime.strptime(published_date, "%Y-%m-%d")
-                    display_date = parsed_date.strftime("%Y-%m-%d")
-                    sort_date = display_date
-                except ValueError:
-                    pass
-
-            # Convert Excel hyperlinks to HTML
-            title_html = self.excel_hyperlink_to_html(title_formula)
-            collection_html = (
-                self.excel_hyperlink_to_html(collection) if collection else ""
-            )
-
-            table_html.append("<tr>")
-            table_html.extend(
-                [
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="read"{" checked" if read else ""}></td>',
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="owned"{" checked" if owned else ""}></td>',
-                    f'<td class="date-col" data-sort="{sort_date}">{display_date}</td>',
-                    f'<td class="title-col">{title_html}</td>',
-                    f'<td class="type-col">{work_type}</td>',
-                    f'<td class="collection-col">{collection_html}</td>',
-                ]
-            )
-            table_html.append("</tr>")
-
-        table_html.extend(["</tbody>", "</table>"])
-
-        return "\n".join(table_html)
+    @staticmethod
+    def row_to_csv_cells(row: ExportRow) -> List[str]:
+        """Render an ExportRow into the six CSV columns.
 
-    def generate_html_table(self, rows: List[List[str]]) -> str:
-        """Generate HTML table with proper formatting and structure."""
-        table_html = [
-            '<table class="works-table">',
-            "<thead>",
-            "<tr>",
-            '<th class="narrow-col">Read</th>',
-            '<th class="narrow-col">Owned</th>',
-            '<th class="date-col">Published</th>',
-            '<th class="title-col">Title</th>',
-            '<th class="type-col">Type</th>',
-            '<th class="collection-col">Collection</th>',
-            "</tr>",
-            "</thead>",
-            "<tbody>",
+        The Excel HYPERLINK formulas exist only at this edge; everywhere
+        else the title/URL pair travels as plain fields.
+        """
+        return [
+            row.read,
+            row.owned,
+            row.published,
+            (
+                KingWorksParser.create_excel_hyperlink(row.url, row.title)
+                if row.url
+                else row.title
+            ),
+            row.work_type,
+            (
+                KingWorksParser.create_excel_hyperlink(
+                    row.collection_url, row.collection
+                )
+                if row.collection and row.collection_url
+                else row.collection
+            ),
         ]
 
-        for row in rows:
-            read = row[0]
-            owned = row[1]
-            published_date = row[2]
-            title_formula = row[3]
-            work_type = row[4]
-            collection = row[5]
-
-            # Handle the published date
-            display_date = ""
-            sort_date = "9999-99-99"  # Default sort value for empty dates
-
-            if published_date and published_date not in ["0000-00-00", "9999-99-99"]:
-                try:
-                    parsed_date = datetime.strptime(published_date, "%Y-%m-%d")
-                    display_date = parsed_date.strftime("%Y-%m-%d")
-                    sort_date = display_date
-                except ValueError:
-                    pass
-
-            # Convert Excel hyperlinks to HTML
-            title_html = self.excel_hyperlink_to_html(title_formula)
-            collection_html = (
-                self.excel_hyperlink_to_html(collection) if collection else ""
-            )
-
-            table_html.append("<tr>")
-            table_html.extend(
-                [
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="read"{" checked" if read else ""}></td>',
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="owned"{" checked" if owned else ""}></td>',
-                    f'<td class="date-col" data-sort="{sort_date}">{display_date}</td>',
-                    f'<td class="title-col">{title_html}</td>',
-                    f'<td class="type-col">{work_type}</td>',
-                    f'<td class="collection-col">{collection_html}</td>',
-                ]
-            )
-            table_html.append("</tr>")
-
-        table_html.extend(["</tbody>", "</table>"])
-
-        return "\n".join(table_html)
-
-    def generate_html_table(self, rows: List[List[str]]) -> str:
+    @staticmethod
+    def generate_html_table(rows: Iterable[ExportRow]) -> str:
         """Generate HTML table with proper formatting and structure."""
-        table_html = [
-            '<table class="works-table">',
-            "<thead>",
-            "<tr>",
-            '<th class="narrow-col">Read</th>',
-            '<th class="narrow-col">Owned</th>',
-            '<th class="date-col">Published</th>',
-            '<th class="title-col">Title</th>',
-            '<th class="type-col">Type</th>',
-            '<th class="collection-col">Collection</th>',
-            "</tr>",
-            "</thead>",
-            "<tbody>",
-        ]
-
-        for row in rows:
-            read = row[0]
-            owned = row[1]
-            published_date = row[2]
-            title_formula = row[3]
-            work_type = row[4]
-            collection = row[5]
-
-            # Handle the published date
-            display_date = ""
-            sort_date = "9999-99-99"  # Default sort value for empty dates
-
-            if published_date and published_date not in ["0000-00-00", "9999-99-99"]:
-                try:
-                    parsed_date = datetime.strptime(published_date, "%Y-%m-%d")
-                    display_date = parsed_date.strftime("%Y-%m-%d")
-                    sort_date = display_date
-                except ValueError:
-                    pass
-
-            # Convert Excel hyperlinks to HTML
-            title_html = self.excel_hyperlink_to_html(title_formula)
-            collection_html = (
-                self.excel_hyperlink_to_html(collection) if collection else ""
-            )
-
-            table_html.append("<tr>")
-            table_html.extend(
-                [
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="read"{" checked" if read else ""}></td>',
-                    f'<td class="narrow-col"><input type="checkbox" class="status-checkbox" data-title="{self.parse_excel_hyperlink(title_formula)[1]}" data-type="owned"{" checked" if owned else ""}></td>',
-                    f'<td class="date-col" data-sort="{sort_date}">{display_date}</td>',
-                    f'<td class="title-col">{title_html}</td>',
-                    f'<td class="type-col">{work_type}</td>',
-                    f'<td class="collection-col">{collection_html}</td>',
-                ]
-            )
-            table_html.append("</tr>")
-
-        table_html.extend(["</tbody>", "</table>"])
+        # One string per row via _render_row, one list built in a single
+        # comprehension, one join: the join sizes its result up front, so
+        # there is no incremental buffer growth at all.
+        parts = [_TABLE_HEADER]
+        parts += [_render_row(row) for row in rows]
+        parts.append("</tbody></table>")
+        return "".join(parts)
 
-        return "\n".join(table_html)
-
-    def extract_title_from_hyperlink(self, hyperlink: str) -> str:
+    @staticmethod
+    def extract_title_from_hyperlink(hyperlink: str) -> str:
         """Extract the title from an Excel or HTML hyperlink."""
+        # Most cells are plain text; one substring scan rejects them before
+        # any prefix test or regex runs
+        if "HYPERLINK" not in hyperlink and "<a " not in hyperlink:
+            return hyperlink
         if hyperlink.startswith("=HYPERLINK"):
             # Extract from Excel hyperlink
-            match = re.search(r'HYPERLINK\("[^"]*",\s*"([^"]+)"\)', hyperlink)
+            match = _HYPERLINK_TEXT_RE.search(hyperlink)
             return match.group(1) if match else ""
         elif "<a href=" in hyperlink:
             # Extract from HTML hyperlink
-            match = re.search(r">([^<]+)</a>", hyperlink)
+            match = _HTML_ANCHOR_TEXT_RE.search(hyperlink)
             return match.group(1) if match else ""
         return hyperlink
 
-    def export_to_html(self, filename: str, works_data: List[List[str]]):
-        """Export works data to HTML file."""
-        # Convert all data to strings first
-        works_data = [
-            [str(cell) if cell is not None else "" for cell in row]
-            for row in works_data
-        ]
-
-        table_content = self.generate_html_table(works_data)
-
-        html_content = self.generate_html_content(table_content)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-    def generate_html_content(self, table_content: str) -> str:
-        """Generate complete HTML document with modern, Stephen King-inspired styling."""
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Stephen King Bibliography</title>
-    <link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;800&display=swap" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Special+Elite&display=swap" rel="stylesheet">
-    <link href="https://fonts.cdnfonts.com/css/portrait-condensed" rel="stylesheet">
-    <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.css">
-    <style>
-        :root {{
-            --blood-red: #8B0000;
-            --blood-red-hover: #A00000;
-            --border-color: #2c3e50;
-            --hover-color: #2a2a2a;
-            --text-secondary: #b3b3b3;
-            --background-dark: #1e1e1e;
-            --background-darker: #252525;
-            --text-primary: #ffffff;
-        }}
-
-        body {{
-            font-family: 'Plus Jakarta Sans', sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: var(--background-dark);
-            color: var(--text-primary);
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-
-        h1 {{
-            font-family: 'Special Elite', cursive;
-            color: var(--blood-red);
-            text-align: center;
-            margin-bottom: 30px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            font-size: 3.5rem;
-            letter-spacing: 2px;
-        }}
-
-        /* DataTables Customization */
-        .dataTables_wrapper {{
-            margin-top: 20px;
-            padding: 20px;
-            background-color: var(--background-darker);
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-        }}
-
-        .dataTables_filter input {{
-            border: 1px solid #2c3e50 !important;
-            border-radius: 4px !important;
-            padding: 6px 10px !important;
-            background-color: var(--background-dark) !important;
-            color: var(--text-primary) !important;
-        }}
-
-        .dataTables_length select {{
-            border: 1px solid #2c3e50 !important;
-            border-radius: 4px !important;
-            padding: 4px 8px !important;
-            background-color: var(--background-dark) !important;
-            color: var(--text-primary) !important;
-        }}
-
-        /* Table Styling */
-        .works-table {{
-            background-color: var(--background-darker) !important;
-            color: var(--text-primary) !important;
-        }}
-
-        .works-table thead th {{
-            background-color: #990000 !important;  /* Deeper blood red for headers */
-            color: var(--text-primary) !important;
-            border-bottom: 2px solid var(--border-color) !important;
-        }}
-
-        .works-table tbody td {{
-            background-color: var(--background-darker) !important;
-            color: var(--text-primary) !important;
-            border-bottom: 1px solid var(--border-color) !important;
-        }}
-
-        .works-table tbody tr:hover td {{
-            background-color: var(--hover-color) !important;
-        }}
-
-        /* DataTables specific styling */
-        .dataTables_info,
-        .dataTables_length label,
-        .dataTables_filter label {{
-            color: var(--text-secondary) !important;
-        }}
-
-        .paginate_button {{
-            color: var(--text-secondary) !important;
-            background-color: var(--background-darker) !important;
-        }}
-
-        .paginate_button.current {{
-            color: var(--text-primary) !important;
-            background-color: #990000 !important;  /* Matching header color */
-            border: 1px solid #990000 !important;
-        }}
-
-        /* Links styling */
-        .works-table a {{
-            color: #cc0000 !important;  /* Brighter red for links */
-            text-decoration: none !important;
-        }}
-
-        .works-table a:hover {{
-            color: #ff0000 !important;  /* Even brighter on hover */
-            text-decoration: underline !important;
-        }}
-
-        /* Completely remove sort arrows */
-        .works-table thead th,
-        table.dataTable thead th,
-        .works-table thead td,
-        table.dataTable thead td {{
-            background-image: none !important;
-            padding-right: 8px !important;  /* Remove extra padding that was for arrows */
-        }}
-
-        /* Override all DataTables sorting classes */
-        table.dataTable thead .sorting::before,
-        table.dataTable thead .sorting::after,
-        table.dataTable thead .sorting_asc::before,
-        table.dataTable thead .sorting_asc::after,
-        table.dataTable thead .sorting_desc::before,
-        table.dataTable thead .sorting_desc::after,
-        table.dataTable thead .sorting_asc_disabled::before,
-        table.dataTable thead .sorting_asc_disabled::after,
-        table.dataTable thead .sorting_desc_disabled::before,
-        table.dataTable thead .sorting_desc_disabled::after {{
-            display: none !important;
-            content: "" !important;
-        }}
+    @staticmethod
+    def write_html_content(f, works_data: Iterable[ExportRow]):
+        """Stream the full HTML document to an open binary file object."""
+        f.write(_HTML_PREFIX_BYTES)
+        f.write(_TABLE_HEADER_BYTES)
+        for row in works_data:
+            f.write(_render_row(row).encode("utf-8"))
+        f.write(_TABLE_FOOTER_BYTES)
+        f.write(_HTML_SUFFIX_BYTES)
 
-        /* Optional: Add a subtle cursor change to indicate sortable columns */
-        .works-table thead th,
-        table.dataTable thead th {{
-            cursor: pointer;
-        }}
-    </style>
-    <script type="text/javascript" src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
-    <script type="text/javascript" src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
-    <script>
-        $(document).ready(function() {{
-            $('.works-table').DataTable({{
-                pageLength: 50,
-                order: [[2, 'asc']],
-                fixedHeader: true
-            }});
+    @staticmethod
+    def export_to_html(filename: str, works_data: Iterable[ExportRow]):
+        """Export works data to HTML file.
 
-            $('.status-checkbox').change(function() {{
-                const checkbox = $(this);
-                const title = checkbox.data('title');
-                const type = checkbox.data('type');
-                const isChecked = checkbox.prop('checked');
-                console.log(`${{type}} status for "${{title}}" changed to: ${{isChecked}}`);
-            }});
-        }});
-    </script>
-</head>
-<body>
-    <div class="container">
-        <h1>Stephen King Bibliography</h1>
-        {table_content}
-    </div>
-</body>
-</html>"""
+        Rows are rendered straight into the 1 MiB file buffer, so peak
+        memory stays at the buffer size instead of the whole document.
+        Binary mode: the static chunks are pre-encoded at import and
+        bypass TextIOWrapper entirely.
+        """
+        with open(filename, "wb", buffering=1 << 20) as f:
+            KingWorksParser.write_html_content(f, works_data)
 
     def fix_missing_dates(self, works_list):
         """
         Fix missing dates (0000-00-00) for works in collections by using the collection's publication date.
         """
-        # First pass: Build collection dates dictionary
-        collection_dates = {}
-        for work in works_list:
-            if work.work_type.lower() in [
-                "collection",
-                "anthology",
-                "story collection",
-            ]:
-                if work.published_date and work.published_date != "0000-00-00":
-                    print(
-                        f"Found collection: {work.title} with date {work.published_date}"
-                    )  # Debug print
-                    collection_dates[work.title] = work.published_date
+        # First pass: one dict comprehension, one frozenset membership
+        # test per work (no per-iteration list literal)
+        collection_dates = {
+            work.title: work.published_date
+            for work in works_list
+            if work.work_type.lower() in _COLLECTION_TYPES
+            and work.published_date
+            and work.published_date != "0000-00-00"
+        }
 
         # Second pass: Update works with missing dates
         for work in works_list:
             if work.published_date == "0000-00-00" and work.available_in:
                 collection_title = work.available_in
 
-                # Remove any Excel HYPERLINK formatting if present
-                if "=HYPERLINK" in collection_title:
-                    match = re.search(
-                        r'=HYPERLINK\("[^"]*",\s*"([^"]+)"\)', collection_title
-                    )
+                # Remove any Excel HYPERLINK formatting if present; the
+                # startswith check keeps plain-text names off the regex path
+                if collection_title.startswith("=HYPERLINK"):
+                    match = _HYPERLINK_TEXT_RE.search(collection_title)
                     if match:
                         collection_title = match.group(1)
 
-                if collection_title in collection_dates:
-                    work.published_date = collection_dates[collection_title]
-                    print(
-                        f"Updated {work.title} with date {work.published_date} from collection {collection_title}"
-                    )  # Debug print
+                collection_date = collection_dates.get(collection_title)
+                if collection_date:
+                    work.published_date = collection_date
+                    logger.debug(
+                        "Updated %s with date %s from collection %s",
+                        work.title,
+                        work.published_date,
+                        collection_title,
+                    )
 
     def parse_and_export(self):
         """Parse works and export to both CSV and HTML formats."""
@@ -1062,45 +1263,58 @@ class KingWorksParser:
         if not response:
             return
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        works = soup.find_all("a", class_="row work")
+        tree = lxml.html.fromstring(response.content)
+        works = _WORKS_XPATH(tree)
 
-        formatted_data = []
-        headers = ["Read", "Owned", "Published", "Title", "Type", "Available In"]
+        # Same lock-free dedupe as parse_works: repeats are dropped by
+        # href before any work is submitted to the pool
+        works = list({work.get("href"): work for work in works}.values())
 
-        # Process works with ThreadPoolExecutor
-        processed_works = []
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            futures = [executor.submit(self.process_work, work) for work in works]
-            for future in concurrent.futures.as_completed(futures):
-                if work_data := future.result():
-                    processed_works.append(work_data)
+        # Fetch each collection page once so member works skip their own
+        # detail-page fetch in process_work
+        self.build_collection_index(works)
+
+        # Process works on the shared pool; map avoids allocating a
+        # Future per work and keeps results in page order
+        processed_works = [
+            work_data
+            for work_data in self.executor.map(self.process_work, works)
+            if work_data
+        ]
 
         # Fix missing dates before formatting
         self.fix_missing_dates(processed_works)
 
-        # Format data for export
-        for work_data in processed_works:
-            formatted_row = self.format_row_for_export(work_data)
-            formatted_data.append(formatted_row)
+        # Sort once, chronologically with undated works last.  sorted()'s
+        # key= protocol computes each key exactly once (a decorate-sort),
+        # so the regex-validated date parse runs once per work, not once
+        # per comparison.
+        processed_works.sort(key=self.get_sort_key)
 
         # Generate timestamp for filenames
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _run_timestamp()
         csv_file = f"stephen_king_works_{timestamp}.csv"
+        html_file = f"stephen_king_works_{timestamp}.html"
 
-        # Export to CSV
-        with open(csv_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(formatted_data)
+        # Single pass, both outputs: each work is formatted once and its
+        # row goes straight into the CSV writer and the HTML file buffer,
+        # so no intermediate list of formatted rows is ever materialized.
+        header = ["Read", "Owned", "Published", "Title", "Type", "Available In"]
+        with (
+            open(csv_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as fc,
+            open(html_file, "wb", buffering=1 << 20) as fh,
+        ):
+            writer = csv.writer(fc, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+            writer.writerow(header)
+            fh.write(_HTML_PREFIX_BYTES)
+            fh.write(_TABLE_HEADER_BYTES)
+            for row in map(self.format_row_for_export, processed_works):
+                writer.writerow(self.row_to_csv_cells(row))
+                fh.write(_render_row(row).encode("utf-8"))
+            fh.write(_TABLE_FOOTER_BYTES)
+            fh.write(_HTML_SUFFIX_BYTES)
 
         print(f"CSV file '{csv_file}' created successfully!")
-
-        # Export to HTML
-        html_file = f"stephen_king_works_{timestamp}.html"
-        self.export_to_html(
-            html_file, formatted_data
-        )  # Changed from save_to_html to export_to_html
         print(f"HTML file '{html_file}' created successfully!")
 
 
@@ -1111,6 +1325,11 @@ def main():
         python parse_king_works.py           # Fetch new data and generate files
         python parse_king_works.py --html    # Generate HTML from existing CSV
     """
+    # CLI-only imports stay out of the module import path so importing
+    # this module for its parser/exporters costs nothing extra
+    import argparse
+    import glob
+
     parser = argparse.ArgumentParser(description="Stephen King Works Parser")
     parser.add_argument(
         "--html", action="store_true", help="Generate HTML from existing CSV only"
@@ -1133,25 +1352,48 @@ def main():
                         "No CSV files found! Please run without --html first or specify a CSV file."
                     )
                     return
-                args.csv = max(csv_files)  # Gets most recent file by name
+                # Most recently written file; robust against prefix drift,
+                # unlike comparing the full filenames lexicographically
+                args.csv = max(csv_files, key=os.path.getmtime)
 
             print(f"Reading CSV file: {args.csv}")
 
-            # Read CSV with explicit string conversion
-            df = pd.read_csv(args.csv, dtype=str, na_filter=False)
-            # Replace NaN with empty string
-            df = df.fillna("")
-            works_data = df.values.tolist()
+            # Stream the rows with the stdlib reader; everything arrives as
+            # strings already, so no DataFrame round-trip is needed.  The
+            # HYPERLINK formulas are parsed apart exactly once here, at
+            # load, so the export chain works on structured rows.
+            parse_hyperlink = KingWorksParser.parse_excel_hyperlink
+            works_data = []
+            with open(args.csv, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # skip header
+                for row in reader:
+                    url, title = parse_hyperlink(row[3])
+                    collection_url, collection = parse_hyperlink(row[5])
+                    works_data.append(
+                        ExportRow(
+                            read=row[0],
+                            owned=row[1],
+                            published=row[2],
+                            title=title,
+                            url=url,
+                            work_type=row[4],
+                            collection=collection,
+                            collection_url=collection_url,
+                        )
+                    )
 
-            # Generate timestamp for HTML filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Reuse the input CSV's timestamp when it has one, so the
+            # re-rendered HTML pairs up with its source data
+            ts_match = _CSV_TS_RE.search(os.path.basename(args.csv))
+            timestamp = ts_match.group(1) if ts_match else _run_timestamp()
             html_file = f"stephen_king_works_{timestamp}.html"
 
             print(f"Generating HTML file: {html_file}")
 
-            # Create parser instance and export to HTML
-            parser = KingWorksParser()
-            parser.export_to_html(html_file, works_data)
+            # No parser instance needed: the export chain is static, so the
+            # --html path skips request-manager/session setup entirely
+            KingWorksParser.export_to_html(html_file, works_data)
             print(f"HTML file '{html_file}' created successfully!")
 
         except Exception as e:
@@ -1162,7 +1404,10 @@ def main():
     else:
         # Original functionality - fetch new data and generate both files
         parser = KingWorksParser()
-        parser.parse_and_export()
+        try:
+            parser.parse_and_export()
+        finally:
+            parser.close()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,10 @@ from datetime import datetime
 from typing import List
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ..models.work import Work
+from ..network.request_manager import RequestManager
 
 
 class KingWorksParser:
@@ -17,16 +17,16 @@ class KingWorksParser:
     WORKS_URL = f"{BASE_URL}/works/"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.request_manager = RequestManager()
 
     def extract_collection_info(self, url: str) -> tuple[str, str]:
         """Extract collection information from a work's page."""
         try:
-            response = self.session.get(url)
-            if not response.ok:
+            response = self.request_manager.get(url)
+            if response is None:
                 return ("", "")
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Find the "Available In" section
             available_in = soup.find("h2", string="Available In")
@@ -64,9 +64,10 @@ class KingWorksParser:
 
     def parse_works(self) -> List[Work]:
         """Parse Stephen King works from the website."""
-        response = self.session.get(self.WORKS_URL)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = self.request_manager.get(self.WORKS_URL)
+        if response is None:
+            return []
+        soup = BeautifulSoup(response.text, "lxml")
 
         works = soup.find_all("a", class_="row work")
         works_data = []
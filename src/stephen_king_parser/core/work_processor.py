@@ -1,53 +1,208 @@
-from typing import Optional
+import functools
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterable, Optional
 
+import lxml.html
+import soupsieve as sv
 from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    from selectolax.lexbor import LexborNode
+except ImportError:  # selectolax is optional; BeautifulSoup remains the fallback
+    LexborNode = None
 
 from ..models.work import Work
 
+BASE_URL = "https://stephenking.com"
+
+logger = logging.getLogger(__name__)
+
+# Compiled once so SoupSieve does not re-tokenize the selectors per work.
+_SEL_TITLE = sv.compile(".title")
+_SEL_DATE = sv.compile(".date")
+_SEL_TYPE = sv.compile(".type")
+_SEL_COLL = sv.compile(".collection")
+
+# Compiled XPath for the lxml batch path; one C-level traversal per page.
+_XP_WORKS = etree.XPath('//*[contains(@class, "work-item")]')
+_XP_TITLE = etree.XPath('.//*[contains(@class, "title")]/text()')
+_XP_DATE = etree.XPath('.//*[contains(@class, "date")]/text()')
+_XP_TYPE = etree.XPath('.//*[contains(@class, "type")]/text()')
+_XP_COLL = etree.XPath('.//*[contains(@class, "collection")]')
+_XP_COLL_HREF = etree.XPath(".//a/@href")
+
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a strict YYYY-MM-DD string without strptime's format machinery.
+
+    Memoized because works on the same page frequently share a date; datetime
+    is immutable, so handing back a shared instance is safe.
+    """
+    m = _DATE_RE.match(date_str)
+    if m:
+        try:
+            return datetime(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            pass
+    return datetime.max
+
 
 class WorkProcessor:
     @staticmethod
-    def process_work(soup: BeautifulSoup) -> Optional[Work]:
-        """Process a single work element more efficiently"""
+    def process_work(
+        soup: BeautifulSoup,
+        _base_url: str = BASE_URL,
+        _parse_date=_parse_date,
+        _log: logging.Logger = logger,
+    ) -> Optional[Work]:
+        """Process a single work element more efficiently.
+
+        Hot globals are pre-bound as defaults so each call resolves them as
+        locals instead of repeated LOAD_GLOBAL lookups.
+        """
+        if LexborNode is not None and isinstance(soup, LexborNode):
+            return WorkProcessor._process_work_node(soup)
         try:
-            # Extract data using direct selectors
-            title = soup.select_one(".title").get_text(strip=True)
-            link = f"{base_url}{soup.get('href', '')}"
+            # Extract data using precompiled selectors
+            title = _SEL_TITLE.select_one(soup).get_text(strip=True)
+            href = soup.get("href", "")
+            link = f"{_base_url}{href}"
 
             # Use more efficient date extraction
-            date_elem = soup.select_one(".date")
+            date_elem = _SEL_DATE.select_one(soup)
             published_date = None
             if date_elem:
-                date_str = date_elem.get_text(strip=True)
-                try:
-                    published_date = datetime.strptime(date_str, "%Y-%m-%d")
-                except ValueError:
-                    published_date = datetime.max
+                published_date = _parse_date(date_elem.get_text(strip=True))
 
             # Optimize type extraction
-            type_elem = soup.select_one(".type")
+            type_elem = _SEL_TYPE.select_one(soup)
             work_type = type_elem.get_text(strip=True) if type_elem else "Unknown"
 
             # Efficient collection processing
-            collection_elem = soup.select_one(".collection")
+            collection_elem = _SEL_COLL.select_one(soup)
             collection = (
                 collection_elem.get_text(strip=True) if collection_elem else None
             )
             collection_link = None
-            if collection_elem and collection_elem.find("a"):
-                collection_link = (
-                    f"{base_url}{collection_elem.find('a').get('href', '')}"
-                )
+            if collection_elem and (anchor := collection_elem.find("a")) is not None:
+                collection_link = f"{_base_url}{anchor.get('href', '')}"
+
+            return Work(
+                title=title,
+                published_date=published_date,
+                work_type=work_type,
+                url=link,
+                available_in=collection_link or collection,
+            )
+
+        except Exception as e:
+            _log.error(f"Error processing work element: {e}")
+            return None
+
+    @classmethod
+    def process_many(cls, soups: Iterable) -> "list[Work]":
+        """Process independent work elements in parallel threads.
+
+        Extraction under lxml releases the GIL in its C parser, so threads
+        scale here without the pickling cost a process pool would add.
+        executor.map's chunksize only matters for process pools, so it is
+        left at its default.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            return [work for work in ex.map(cls.process_work, soups) if work]
+
+    @staticmethod
+    def process_page(html: str) -> "list[Work]":
+        """Parse a whole page once with lxml and extract every work element."""
+        tree = lxml.html.fromstring(html)
+        works = map(WorkProcessor._process_work_element, _XP_WORKS(tree))
+        return [work for work in works if work]
+
+    @staticmethod
+    def _process_work_element(
+        element: "lxml.html.HtmlElement",
+        _base_url: str = BASE_URL,
+        _parse_date=_parse_date,
+        _log: logging.Logger = logger,
+    ) -> Optional[Work]:
+        """Extract one work from an lxml element using the compiled XPaths."""
+        try:
+            title = _XP_TITLE(element)[0].strip()
+            link = f"{_base_url}{element.get('href', '')}"
+
+            dates = _XP_DATE(element)
+            published_date = _parse_date(dates[0].strip()) if dates else None
+
+            types = _XP_TYPE(element)
+            work_type = types[0].strip() if types else "Unknown"
+
+            collections = _XP_COLL(element)
+            collection = None
+            collection_link = None
+            if collections:
+                collection = collections[0].text_content().strip()
+                hrefs = _XP_COLL_HREF(collections[0])
+                if hrefs:
+                    collection_link = f"{_base_url}{hrefs[0]}"
+
+            return Work(
+                title=title,
+                published_date=published_date,
+                work_type=work_type,
+                url=link,
+                available_in=collection_link or collection,
+            )
+
+        except Exception as e:
+            _log.error(f"Error processing work element: {e}")
+            return None
+
+    @staticmethod
+    def _process_work_node(
+        node: "LexborNode",
+        _base_url: str = BASE_URL,
+        _parse_date=_parse_date,
+        _log: logging.Logger = logger,
+    ) -> Optional[Work]:
+        """Fast path: process a selectolax Lexbor node without bs4 Tag wrappers."""
+        try:
+            title = node.css_first(".title").text(strip=True)
+            link = f"{_base_url}{node.attributes.get('href') or ''}"
+
+            date_elem = node.css_first(".date")
+            published_date = None
+            if date_elem:
+                published_date = _parse_date(date_elem.text(strip=True))
+
+            type_elem = node.css_first(".type")
+            work_type = type_elem.text(strip=True) if type_elem else "Unknown"
+
+            collection_elem = node.css_first(".collection")
+            collection = collection_elem.text(strip=True) if collection_elem else None
+            collection_link = None
+            if collection_elem:
+                anchor = collection_elem.css_first("a")
+                if anchor:
+                    collection_link = (
+                        f"{_base_url}{anchor.attributes.get('href') or ''}"
+                    )
 
             return Work(
                 title=title,
-                link=link,
                 published_date=published_date,
                 work_type=work_type,
-                collection=collection,
-                collection_link=collection_link,
+                url=link,
+                available_in=collection_link or collection,
             )
 
         except Exception as e:
-            logging.error(f"Error processing work element: {e}")
+            _log.error(f"Error processing work element: {e}")
             return None
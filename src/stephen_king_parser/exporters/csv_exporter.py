@@ -1,9 +1,19 @@
-import csv
 import os
 from typing import List
 
 from ..core.work import Work
 
+_HEADER = b"Read,Published Date,Title,Type,Collection\r\n"
+
+
+def _escape(field: str) -> str:
+    """Quote a CSV field only when it needs it (comma, quote, or newline)."""
+    if '"' in field:
+        return '"' + field.replace('"', '""') + '"'
+    if "," in field or "\n" in field or "\r" in field:
+        return '"' + field + '"'
+    return field
+
 
 class CSVExporter:
     @staticmethod
@@ -21,27 +31,25 @@ class CSVExporter:
         # Create the CSV file path
         csv_file = os.path.join(csv_dir, "stephen_king_works.csv")
 
-        with open(csv_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Write header
-            writer.writerow(["Read", "Published Date", "Title", "Type", "Collection"])
-
-            # Write data
+        # Rows are pre-formatted and written as bytes through a large buffer;
+        # csv.writer's per-field quoting machinery is overkill for this schema.
+        with open(csv_file, "wb", buffering=1 << 20) as f:
+            f.write(_HEADER)
             for work in works:
                 title_cell = (
-                    CSVExporter.create_excel_hyperlink(work.link, work.title)
-                    if work.link
+                    CSVExporter.create_excel_hyperlink(work.url, work.title)
+                    if work.url
                     else work.title
                 )
-                writer.writerow(
-                    [
-                        "",  # Read status (empty by default)
-                        work.published_date,
-                        title_cell,
-                        work.work_type,
-                        work.available_in if work.available_in else "",
-                    ]
+                published = (
+                    "" if work.published_date is None else str(work.published_date)
+                )
+                line = (
+                    f",{_escape(published)}"
+                    f",{_escape(title_cell)}"
+                    f",{_escape(work.work_type or '')}"
+                    f",{_escape(work.available_in or '')}\r\n"
                 )
+                f.write(line.encode("utf-8"))
 
         return csv_file
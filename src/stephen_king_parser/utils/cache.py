@@ -1,10 +1,32 @@
 import hashlib
 import json
-from datetime import datetime, timedelta
+import mmap
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
-import aiofiles
+try:
+    import orjson
+except ImportError:  # optional Rust-backed codec; stdlib json otherwise
+    orjson = None
+
+# Entries larger than this (full HTML pages) are decoded straight from an mmap
+# instead of copying the file body into the heap first.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class Cache:
@@ -12,40 +34,68 @@ class Cache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl
+        # Process-local LRU so repeated lookups skip disk I/O and JSON decode.
+        self._mem: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._mem_max = 1024
 
     def _get_cache_path(self, key: str) -> Path:
         """Generate cache file path from key"""
-        hashed_key = hashlib.md5(key.encode()).hexdigest()
+        hashed_key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{hashed_key}.json"
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        cache_path = self._get_cache_path(key)
-        if not cache_path.exists():
-            return None
+        entry = self._mem.get(key)
+        if entry is not None:
+            if entry[0] + self.ttl > time.time():
+                self._mem.move_to_end(key)
+                return entry[1]
+            del self._mem[key]
 
+        cache_path = self._get_cache_path(key)
         try:
-            async with aiofiles.open(cache_path, "r") as f:
-                data = json.loads(await f.read())
+            with open(cache_path, "rb") as f:
                 if (
-                    datetime.fromisoformat(data["timestamp"])
-                    + timedelta(seconds=self.ttl)
-                    > datetime.now()
+                    orjson is not None
+                    and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD
                 ):
-                    return data["content"]
-        except (json.JSONDecodeError, KeyError, ValueError):
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            data = orjson.loads(view)
+                        finally:
+                            view.release()
+                else:
+                    data = _loads(f.read())
+            if data["timestamp"] + self.ttl > time.time():
+                self._remember(key, data["timestamp"], data["content"])
+                return data["content"]
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
             await self.delete(key)
         return None
 
+    def _remember(self, key: str, timestamp: float, value: Any) -> None:
+        """Store an entry in the in-memory LRU, evicting the oldest past capacity."""
+        self._mem[key] = (timestamp, value)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
+
     async def set(self, key: str, value: Any) -> None:
         """Set value in cache with timestamp"""
         cache_path = self._get_cache_path(key)
-        data = {"timestamp": datetime.now().isoformat(), "content": value}
-        async with aiofiles.open(cache_path, "w") as f:
-            await f.write(json.dumps(data))
+        data = {"timestamp": time.time(), "content": value}
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(data))
+        os.replace(tmp_path, cache_path)
+        self._remember(key, data["timestamp"], value)
 
     async def delete(self, key: str) -> None:
         """Delete key from cache"""
+        self._mem.pop(key, None)
         cache_path = self._get_cache_path(key)
         try:
             cache_path.unlink(missing_ok=True)
@@ -54,6 +104,7 @@ class Cache:
 
     async def clear(self) -> None:
         """Clear all cached data"""
+        self._mem.clear()
         for cache_file in self.cache_dir.glob("*.json"):
             try:
                 cache_file.unlink()
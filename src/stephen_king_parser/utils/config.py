@@ -1,21 +1,31 @@
+import json
+import os
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import Optional
 
-from pydantic import BaseSettings, HttpUrl
 
-
-class Settings(BaseSettings):
-    base_url: HttpUrl = "https://www.stephenking.com"
-    rate_limit: float = 0.5
-    cache_dir: Path = Path(".cache")
-    log_level: str = "INFO"
-    timeout: int = 30
+@dataclass(frozen=True, slots=True)
+class Settings:
+    base_url: str = os.getenv("KING_PARSER_BASE_URL", "https://www.stephenking.com")
+    rate_limit: float = float(os.getenv("KING_PARSER_RATE_LIMIT", "0.5"))
+    cache_dir: Path = Path(os.getenv("KING_PARSER_CACHE_DIR", ".cache"))
+    log_level: str = os.getenv("KING_PARSER_LOG_LEVEL", "INFO")
+    timeout: int = int(os.getenv("KING_PARSER_TIMEOUT", "30"))
 
 
 def load_config(config_path: Optional[str] = None) -> Settings:
-    """Load configuration from file and/or environment variables"""
-    settings = Settings()
-
-    if config_path:
-        settings = Settings.parse_file(config_path)
+    """Load configuration from environment variables and an optional JSON file"""
+    if not config_path:
+        return Settings()
 
-    return settings
+    data = json.loads(Path(config_path).read_text(encoding="utf-8"))
+    known = {field.name for field in fields(Settings)}
+    kwargs = {key: value for key, value in data.items() if key in known}
+    if "cache_dir" in kwargs:
+        kwargs["cache_dir"] = Path(kwargs["cache_dir"])
+    if "rate_limit" in kwargs:
+        kwargs["rate_limit"] = float(kwargs["rate_limit"])
+    if "timeout" in kwargs:
+        kwargs["timeout"] = int(kwargs["timeout"])
+    return Settings(**kwargs)